@@ -2,19 +2,29 @@ import math
 import random
 import sys
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; the kernels below then run as plain Python.
+    njit = None
+
 # --- Game Config ---
 WIDTH, HEIGHT = 960, 540
 FPS = 60
+PAUSED_FPS = 30
 WATERLINE = HEIGHT * 0.62
 WAVE_POINTS = 160          # fidelity of the water mesh
 WAVE_SPEED = 0.95          # global wave phase speed
 BASE_AMPLITUDE = 46        # base wave height
 AMPLITUDE_SWAY = 30        # extra amplitude that swells over time
 WAVELENGTH = 220           # distance between crests
+PHASE_PERIOD = 20 * math.pi  # wave/buoy sines all repeat over this phase span
 
 PLAYER_RADIUS = 14
 PLAYER_GRAVITY = 0.75
@@ -28,6 +38,13 @@ ENEMY_MIN_SPEED = 2.8
 ENEMY_MAX_SPEED = 5.2
 ENEMY_RADIUS = 14
 
+MAX_PARTICLES = 1024         # oldest spray is dropped beyond this
+FOAM_MIN_RADIUS = 8
+CURL_SPRAY_ORIGIN = (64, 4)  # lip tip position inside the pre-rendered spray bands
+_FOAM_RADII = (5, 4, 3, 2, 2)  # curl droplet radii, largest nearest the lip
+WATER_STRIP_LEAD = 2        # rows of the depth-band strip that sit above the surface
+WATER_OVERHANG = 32         # crest wobble and foam dots reach this far above the mesh
+
 PULSE_COLOR = (120, 220, 255)
 PULSE_RADIUS_MAX = 260
 PULSE_THICKNESS = 4
@@ -47,6 +64,8 @@ BACKGROUND_BOTTOM = (4, 10, 22)
 WATER_TOP = (32, 158, 206)
 WATER_BOTTOM = (4, 64, 122)
 WATER_GLOW = (18, 96, 168)
+CREST_COLOR = (224, 248, 255)
+FOAM_COLOR = (240, 252, 255, 160)
 SPRAY_COLOR = (220, 250, 255)
 UI_PANEL = (12, 28, 54, 210)
 UI_ACCENT = (96, 222, 255)
@@ -69,68 +88,220 @@ large_font = pygame.font.SysFont("bahnschrift", 32, bold=True)
 
 
 # --- Helpers ---
+def _jit(fn):
+    """Compile a numeric kernel to native code when Numba is installed."""
+    if njit is None:
+        return fn
+    return njit(cache=True, fastmath=True)(fn)
+
+
 def lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
+def _alpha_surface(size: Tuple[int, int]) -> pygame.Surface:
+    """Per-pixel-alpha surface already in the display format, so blits skip conversion."""
+    return pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+
+
+def _dot_surface(radius: int, color: Tuple[int, ...]) -> pygame.Surface:
+    """A filled circle whose centre sits at (radius, radius)."""
+    dot = _alpha_surface((radius * 2 + 1, radius * 2 + 1))
+    pygame.draw.circle(dot, color, (radius, radius), radius)
+    return dot
+
+
+WAVE_K = (2 * math.pi) / WAVELENGTH
+_HALF_K = 0.5 * WAVE_K
+_HI_K = 1.7 * WAVE_K
+_sin = math.sin
+
+
 def generate_wave_y(x: float, phase: float, t: float) -> float:
     """Compute water surface Y at X using multiple sine layers."""
-    k = (2 * math.pi) / WAVELENGTH
-    a = BASE_AMPLITUDE + AMPLITUDE_SWAY * (0.5 + 0.5 * math.sin(t * 0.3))
-    y = WATERLINE + a * math.sin(k * x + phase)
-    y += 0.33 * a * math.sin(0.5 * k * x - 0.7 * phase + t * 0.6)
-    y += 0.12 * a * math.sin(1.7 * k * x + 1.9 * phase)
+    a = BASE_AMPLITUDE + AMPLITUDE_SWAY * (0.5 + 0.5 * _sin(t * 0.3))
+    y = WATERLINE + a * _sin(WAVE_K * x + phase)
+    y += 0.33 * a * _sin(_HALF_K * x - 0.7 * phase + t * 0.6)
+    y += 0.12 * a * _sin(_HI_K * x + 1.9 * phase)
     return y
 
 
-def build_wave_mesh(phase: float, t: float) -> List[Tuple[float, float]]:
-    pts = []
-    step = WIDTH / WAVE_POINTS
-    for i in range(WAVE_POINTS + 1):
-        x = i * step
-        y = generate_wave_y(x, phase, t)
-        pts.append((x, y))
-    return pts
+_wave_y = _jit(generate_wave_y)
+
+
+_WAVE_X = np.linspace(0.0, WIDTH, WAVE_POINTS + 1)
+
+
+def _wave_heights(xs: np.ndarray, phase: float, t: float) -> np.ndarray:
+    """Array form of ``generate_wave_y`` for the NumPy fallback."""
+    a = BASE_AMPLITUDE + AMPLITUDE_SWAY * (0.5 + 0.5 * _sin(t * 0.3))
+    ys = WATERLINE + a * np.sin(WAVE_K * xs + phase)
+    ys += 0.33 * a * np.sin(_HALF_K * xs - 0.7 * phase + t * 0.6)
+    ys += 0.12 * a * np.sin(_HI_K * xs + 1.9 * phase)
+    return ys
+
+
+@_jit
+def _wave_mesh_kernel(xs, phase, t, out):
+    for i in range(xs.shape[0]):
+        out[i] = _wave_y(xs[i], phase, t)
+
+
+def build_wave_mesh(phase: float, t: float, out: np.ndarray) -> None:
+    """Write ``generate_wave_y`` for every mesh column into ``out`` in place."""
+    if njit is not None:
+        _wave_mesh_kernel(_WAVE_X, phase, t, out)
+    else:
+        out[:] = _wave_heights(_WAVE_X, phase, t)
+
+
+@lru_cache(maxsize=256)
+def render_ui_text(
+    text: str, color: Tuple[int, int, int], text_font: pygame.font.Font = font
+) -> pygame.Surface:
+    """HUD labels, popups and banners repeat or change only on discrete events,
+    so each distinct (text, colour, font) is rendered once."""
+    return text_font.render(text, True, color).convert_alpha()
 
 
 def create_tone(freq: int, duration: float = 0.12, volume: float = 0.4):
     if not pygame.mixer or not pygame.mixer.get_init():
         return None
-    sample_rate = 44100
+    sample_rate, _, channels = pygame.mixer.get_init()
     sample_count = int(duration * sample_rate)
-    buf = bytearray()
-    for i in range(sample_count):
-        t = i / sample_rate
-        sample = int(32767 * math.sin(2 * math.pi * freq * t))
-        buf += int(sample).to_bytes(2, byteorder="little", signed=True)
-    sound = pygame.mixer.Sound(buffer=bytes(buf))
+    t = np.arange(sample_count) / sample_rate
+    samples = (32767 * np.sin(2 * math.pi * freq * t)).astype(np.int16)
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    sound = pygame.sndarray.make_sound(samples)
     sound.set_volume(volume)
     return sound
 
 
-class Particle:
-    __slots__ = ("x", "y", "vx", "vy", "life", "start_life")
+# The tones never change, so they are synthesized once and shared by every Game.
+HIT_SOUND = create_tone(220, duration=0.18, volume=0.5)
+PULSE_SOUND = create_tone(660, duration=0.1, volume=0.35)
+SCORE_SOUND = create_tone(440, duration=0.12, volume=0.4)
+SPECIAL_SOUND = create_tone(880, duration=0.16, volume=0.35)
+
+
+class ArrayStore:
+    """Parallel NumPy columns whose first ``count`` rows are live."""
+
+    FIELDS: Tuple[Tuple[str, type], ...] = ()
 
-    def __init__(self, x: float, y: float, vx: float, vy: float, life: float = 0.8):
-        self.x, self.y, self.vx, self.vy, self.life = x, y, vx, vy, life
-        self.start_life = life
+    def __init__(self, capacity: int = 32):
+        self.count = 0
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, extra: int) -> None:
+        capacity = len(getattr(self, self.FIELDS[0][0]))
+        if self.count + extra <= capacity:
+            return
+        while self.count + extra > capacity:
+            capacity *= 2
+        for name, dtype in self.FIELDS:
+            grown = np.zeros(capacity, dtype=dtype)
+            grown[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, grown)
+
+    def _keep(self, mask: np.ndarray) -> None:
+        """Compact to the rows where ``mask`` is set, preserving their order."""
+        keep = np.flatnonzero(mask)
+        if len(keep) == self.count:
+            return
+        for name, _ in self.FIELDS:
+            column = getattr(self, name)
+            column[: len(keep)] = column[keep]
+        self.count = len(keep)
+
+
+@_jit
+def _step_particles(x, y, vx, vy, life, start_life, count, dt):
+    """Integrate the live particles and pack survivors to the front; returns the new count."""
+    n = 0
+    for i in range(count):
+        remaining = life[i] - dt
+        if remaining <= 0:
+            continue
+        x[n] = x[i] + vx[i] * dt
+        y[n] = y[i] + vy[i] * dt
+        vx[n] = vx[i]
+        vy[n] = vy[i] + 40 * dt
+        life[n] = remaining
+        start_life[n] = start_life[i]
+        n += 1
+    return n
+
+
+class ParticleField(ArrayStore):
+    """Spray particles, integrated together in one vectorized step."""
+
+    FIELDS = (
+        ("x", np.float64),
+        ("y", np.float64),
+        ("vx", np.float64),
+        ("vy", np.float64),
+        ("life", np.float64),
+        ("start_life", np.float64),
+    )
+    FADED_COLOR = np.array((55, 80, 110))
+    SHADES = 256
+    _shade_dots: List[pygame.Surface] = []
+
+    def emit(self, x, y, vx, vy, life: float = 0.8) -> None:
+        """Append a batch of particles given as equal-length arrays."""
+        n = len(x)
+        excess = self.count + n - MAX_PARTICLES
+        if excess > 0:
+            # Rows stay in emission order, so the oldest spray is at the front.
+            self._keep(np.arange(self.count) >= excess)
+        self._reserve(n)
+        rows = slice(self.count, self.count + n)
+        self.x[rows] = x
+        self.y[rows] = y
+        self.vx[rows] = vx
+        self.vy[rows] = vy
+        self.life[rows] = life
+        self.start_life[rows] = life
+        self.count += n
 
     def update(self, dt: float) -> None:
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += 40 * dt
-        self.life -= dt
+        if njit is not None:
+            self.count = _step_particles(
+                self.x, self.y, self.vx, self.vy, self.life, self.start_life, self.count, dt
+            )
+            return
+        n = self.count
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.vy[:n] += 40 * dt
+        self.life[:n] -= dt
+        self._keep(self.life[:n] > 0)
 
     def draw(self, surf: pygame.Surface) -> None:
-        if self.life <= 0:
+        n = self.count
+        if n == 0:
             return
-        fade = max(0.0, min(1.0, self.life / self.start_life))
-        color = (
-            int(SPRAY_COLOR[0] * fade + 55 * (1 - fade)),
-            int(SPRAY_COLOR[1] * fade + 80 * (1 - fade)),
-            int(SPRAY_COLOR[2] * fade + 110 * (1 - fade)),
-        )
-        pygame.draw.circle(surf, color, (int(self.x), int(self.y)), 2)
+        dots = self._dots()
+        fade = np.clip(self.life[:n] / self.start_life[:n], 0.0, 1.0)
+        shades = np.rint(fade * (self.SHADES - 1)).astype(int).tolist()
+        xs = (self.x[:n].astype(int) - 2).tolist()
+        ys = (self.y[:n].astype(int) - 2).tolist()
+        surf.blits([(dots[i], (x, y)) for i, x, y in zip(shades, xs, ys)], doreturn=0)
+
+    @classmethod
+    def _dots(cls) -> List[pygame.Surface]:
+        """One radius-2 dot per fade step, from faded blue up to full spray white."""
+        if not cls._shade_dots:
+            fade = np.linspace(0.0, 1.0, cls.SHADES)[:, None]
+            colors = np.array(SPRAY_COLOR) * fade + cls.FADED_COLOR * (1 - fade)
+            cls._shade_dots = [_dot_surface(2, tuple(c)) for c in colors.astype(int).tolist()]
+        return cls._shade_dots
 
 
 class Pulse:
@@ -152,6 +323,8 @@ class Pulse:
 
 
 class Harpoon:
+    _sprite_cache: Dict[int, pygame.Surface] = {}
+
     def __init__(self, x: float, y: float, direction: int):
         self.x = x
         self.y = y
@@ -159,83 +332,190 @@ class Harpoon:
         self.vx = HARPOON_SPEED * direction
         self.alive = True
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, time_phase: float) -> None:
         self.x += self.vx * dt
-        self.y += math.sin(pygame.time.get_ticks() * 0.002 + self.x * 0.01) * 10 * dt
+        self.y += math.sin(time_phase + self.x * 0.01) * 10 * dt
         if self.x < -60 or self.x > WIDTH + 60:
             self.alive = False
 
-    def draw(self, surf: pygame.Surface) -> None:
-        if not self.alive:
-            return
-        color = (222, 244, 255)
+    def stamp(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        sprite = self._sprite_cache.get(self.direction)
+        if sprite is None:
+            sprite = self._render_sprite(self.direction)
+            self._sprite_cache[self.direction] = sprite
+        return sprite, (int(self.x) - 24, int(self.y) - 3)
+
+    @staticmethod
+    def _render_sprite(direction: int) -> pygame.Surface:
+        """Draw the harpoon with its tip at (24, 3)."""
+        sprite = _alpha_surface((49, 7))
+        x, y = 24, 3
         points = [
-            (self.x, self.y),
-            (self.x - 16 * self.direction, self.y - 2),
-            (self.x - 16 * self.direction, self.y + 2),
+            (x, y),
+            (x - 16 * direction, y - 2),
+            (x - 16 * direction, y + 2),
         ]
-        pygame.draw.polygon(surf, color, points)
+        pygame.draw.polygon(sprite, (222, 244, 255), points)
         pygame.draw.line(
-            surf,
+            sprite,
             (140, 210, 255),
-            (self.x - 16 * self.direction, self.y),
-            (self.x - 24 * self.direction, self.y),
+            (x - 16 * direction, y),
+            (x - 24 * direction, y),
             2,
         )
-
-
-class Enemy:
-    VARIANT_COLORS = {
-        "standard": ENEMY_COLOR,
-        "hopper": (88, 236, 196),
-        "diver": (180, 132, 255),
-        "charger": (255, 140, 130),
-    }
-
-    def __init__(self, x: float, speed: float, variant: str):
-        self.x = x
-        self.speed = speed
-        self.variant = variant
-        self.alive = True
-        self.t = 0.0
-        self.y = WATERLINE
-        self.warning = 0.4
-        self.wave_offset = random.uniform(0, math.pi * 2)
-
-    def update(self, dt: float, phase: float, t: float) -> None:
-        self.t += dt
-        self.x -= self.speed * 60 * dt
-        wave_y = generate_wave_y(self.x, phase, t)
-
-        if self.variant == "hopper":
-            hop = math.sin(self.t * 3.4) * 30 * max(0.0, 1.0 - self.warning * 2)
-            self.y = wave_y - 6 - hop
-        elif self.variant == "diver":
-            dive = math.sin(self.t * 2.2 + 1.2) * 18
-            self.y = wave_y - 6 + dive
-        elif self.variant == "charger":
-            dive = math.sin(self.t * 6.0 + self.wave_offset) * 6
-            self.y = wave_y - 12 + dive
-            self.speed *= 1.005
+        return sprite
+
+
+ENEMY_STANDARD, ENEMY_HOPPER, ENEMY_DIVER, ENEMY_CHARGER = range(4)
+ENEMY_VARIANTS = ("standard", "hopper", "diver", "charger")
+
+
+@_jit
+def _update_enemies(x, y, speed, age, warning, wave_offset, variant, alive, count, dt, phase, t):
+    for i in range(count):
+        age[i] += dt
+        x[i] -= speed[i] * 60 * dt
+        wave_y = _wave_y(x[i], phase, t)
+
+        kind = variant[i]
+        if kind == ENEMY_HOPPER:
+            hop = math.sin(age[i] * 3.4) * 30 * max(0.0, 1.0 - warning[i] * 2)
+            y[i] = wave_y - 6 - hop
+        elif kind == ENEMY_DIVER:
+            dive = math.sin(age[i] * 2.2 + 1.2) * 18
+            y[i] = wave_y - 6 + dive
+        elif kind == ENEMY_CHARGER:
+            dive = math.sin(age[i] * 6.0 + wave_offset[i]) * 6
+            y[i] = wave_y - 12 + dive
+            speed[i] *= 1.005
         else:
-            self.y = wave_y - 6
+            y[i] = wave_y - 6
+
+        if x[i] < -40:
+            alive[i] = False
+
+        if warning[i] > 0:
+            warning[i] -= dt
+
+
+class EnemySchool(ArrayStore):
+    """Every live enemy, stored as parallel arrays so one kernel moves them all."""
+
+    FIELDS = (
+        ("x", np.float64),
+        ("y", np.float64),
+        ("speed", np.float64),
+        ("age", np.float64),
+        ("warning", np.float64),
+        ("wave_offset", np.float64),
+        ("variant", np.int8),
+        ("alive", np.bool_),
+    )
+
+    VARIANT_COLORS = (
+        ENEMY_COLOR,
+        (88, 236, 196),
+        (180, 132, 255),
+        (255, 140, 130),
+    )
+    _sprite_cache: Dict[int, pygame.Surface] = {}
+    _flash_cache: Dict[int, List[pygame.Surface]] = {}
+    FLASH_ALPHA = 200  # alpha of a fresh 0.4s warning flash
+    FLASH_STEPS = 32
+
+    def spawn(self, x, speed, variant, wave_offset) -> None:
+        """Append a wave of enemies given as equal-length arrays; ``variant`` holds ids."""
+        n = len(x)
+        self._reserve(n)
+        rows = slice(self.count, self.count + n)
+        self.x[rows] = x
+        self.y[rows] = WATERLINE
+        self.speed[rows] = speed
+        self.age[rows] = 0.0
+        self.warning[rows] = 0.4
+        self.wave_offset[rows] = wave_offset
+        self.variant[rows] = variant
+        self.alive[rows] = True
+        self.count += n
 
-        if self.x < -40:
-            self.alive = False
+    def update(self, dt: float, phase: float, t: float) -> None:
+        if njit is None:
+            self._update_vectorized(dt, phase, t)
+            return
+        _update_enemies(
+            self.x,
+            self.y,
+            self.speed,
+            self.age,
+            self.warning,
+            self.wave_offset,
+            self.variant,
+            self.alive,
+            self.count,
+            dt,
+            phase,
+            t,
+        )
 
-        if self.warning > 0:
-            self.warning -= dt
+    def _update_vectorized(self, dt: float, phase: float, t: float) -> None:
+        """NumPy equivalent of ``_update_enemies`` for when Numba is missing."""
+        n = self.count
+        x, y, speed = self.x[:n], self.y[:n], self.speed[:n]
+        age, warning, kind = self.age[:n], self.warning[:n], self.variant[:n]
+        age += dt
+        x -= speed * 60 * dt
+        y[:] = _wave_heights(x, phase, t) - 6
+
+        hop = kind == ENEMY_HOPPER
+        y[hop] -= np.sin(age[hop] * 3.4) * 30 * np.maximum(0.0, 1.0 - warning[hop] * 2)
+        dive = kind == ENEMY_DIVER
+        y[dive] += np.sin(age[dive] * 2.2 + 1.2) * 18
+        charge = kind == ENEMY_CHARGER
+        y[charge] += np.sin(age[charge] * 6.0 + self.wave_offset[:n][charge]) * 6 - 6
+        speed[charge] *= 1.005
+
+        self.alive[:n] &= x >= -40
+        warning[warning > 0] -= dt
+
+    def compact(self) -> None:
+        """Drop dead enemies while keeping the survivors in spawn order."""
+        self._keep(self.alive[: self.count])
 
     def draw(self, surf: pygame.Surface) -> None:
-        color = self.VARIANT_COLORS.get(self.variant, ENEMY_COLOR)
-        px = int(self.x)
-        py = int(self.y)
+        n = self.count
+        if n == 0:
+            return
+        sprites = [self._sprite(v) for v in range(len(ENEMY_VARIANTS))]
+        w, h = sprites[0].get_size()
+        xs = self.x[:n].astype(int).tolist()
+        ys = self.y[:n].astype(int).tolist()
+        variants = self.variant[:n].tolist()
+        # Round the per-frame alpha to the nearest pre-faded step.
+        alphas = (self.FLASH_ALPHA * (self.warning[:n] / 0.4)).astype(int)
+        steps = np.rint(alphas * ((self.FLASH_STEPS - 1) / self.FLASH_ALPHA)).astype(int).tolist()
+        stamps = []
+        for v, px, py, step in zip(variants, xs, ys, steps):
+            stamps.append((sprites[v], (px - w // 2, py - h // 2)))
+            if step > 0:
+                flash = self._flashes(v)[step]
+                fw, fh = flash.get_size()
+                stamps.append((flash, (px - fw // 2, py - fh // 2)))
+        surf.blits(stamps, doreturn=0)
+
+    @classmethod
+    def _sprite(cls, variant: int) -> pygame.Surface:
+        sprite = cls._sprite_cache.get(variant)
+        if sprite is None:
+            sprite = cls._build_sprite(cls.VARIANT_COLORS[variant])
+            cls._sprite_cache[variant] = sprite
+        return sprite
+
+    @staticmethod
+    def _build_sprite(color: Tuple[int, int, int]) -> pygame.Surface:
         body_length = ENEMY_RADIUS * 3
         body_height = ENEMY_RADIUS * 1.4
-        body_rect = pygame.Rect(0, 0, body_length, int(body_height))
-        body_rect.center = (px, py)
-        fish_surface = pygame.Surface((body_length + 20, int(body_height) + 20), pygame.SRCALPHA)
-        local_rect = body_rect.copy()
+        fish_surface = _alpha_surface((body_length + 20, int(body_height) + 20))
+        local_rect = pygame.Rect(0, 0, body_length, int(body_height))
         local_rect.center = (fish_surface.get_width() // 2, fish_surface.get_height() // 2)
         pygame.draw.ellipse(fish_surface, color, local_rect)
 
@@ -250,39 +530,34 @@ class Enemy:
         eye_y = local_rect.centery - body_height * 0.15
         pygame.draw.circle(fish_surface, (12, 28, 48), (int(eye_x), int(eye_y)), 3)
         pygame.draw.circle(fish_surface, (240, 252, 255), (int(eye_x) + 1, int(eye_y) - 1), 1)
-
-        surf.blit(
-            fish_surface,
-            (
-                px - fish_surface.get_width() // 2,
-                py - fish_surface.get_height() // 2,
-            ),
-        )
-
-        if self.warning > 0:
-            alpha = int(200 * (self.warning / 0.4))
-            overlay_color = (*color, alpha)
-            flash_surface = pygame.Surface(
-                (body_length + 28, int(body_height) + 28), pygame.SRCALPHA
-            )
-            pygame.draw.ellipse(flash_surface, overlay_color, flash_surface.get_rect(), 6)
-            surf.blit(
-                flash_surface,
-                (
-                    px - flash_surface.get_width() // 2,
-                    py - flash_surface.get_height() // 2,
-                ),
-            )
-
-    def hit_by_pulse(self, pulse: "Pulse") -> bool:
-        if not pulse.alive:
-            return False
-        dx = self.x - pulse.x
-        dy = self.y - pulse.y
-        return dx * dx + dy * dy <= (pulse.r + ENEMY_RADIUS) ** 2
+        return fish_surface
+
+    @classmethod
+    def _flashes(cls, variant: int) -> List[pygame.Surface]:
+        """Pre-faded flash copies, so warnings batch with the sprites."""
+        flashes = cls._flash_cache.get(variant)
+        if flashes is None:
+            outline = cls._build_flash(cls.VARIANT_COLORS[variant])
+            flashes = []
+            for step in range(cls.FLASH_STEPS):
+                flash = outline.copy()
+                flash.set_alpha(round(cls.FLASH_ALPHA * step / (cls.FLASH_STEPS - 1)))
+                flashes.append(flash)
+            cls._flash_cache[variant] = flashes
+        return flashes
+
+    @staticmethod
+    def _build_flash(color: Tuple[int, int, int]) -> pygame.Surface:
+        body_length = ENEMY_RADIUS * 3
+        body_height = ENEMY_RADIUS * 1.4
+        flash = _alpha_surface((body_length + 28, int(body_height) + 28))
+        pygame.draw.ellipse(flash, color, flash.get_rect(), 6)
+        return flash
 
 
 class Player:
+    _sprite_cache: Dict[Tuple[bool, int], pygame.Surface] = {}
+
     def __init__(self):
         self.anchor_x = WIDTH * 0.3
         self.x = self.anchor_x
@@ -306,7 +581,7 @@ class Player:
         dt: float,
         phase: float,
         t: float,
-        _particles: List[Particle],
+        _particles: ParticleField,
         _jump_request: Optional[str],
     ) -> None:
         self.x = self.anchor_x
@@ -331,76 +606,87 @@ class Player:
 
     def draw(self, surf: pygame.Surface) -> None:
         flicker = self.iframes > 0 and int(pygame.time.get_ticks() * 0.02) % 2 == 0
-        base_color = (232, 240, 252) if not flicker else (120, 140, 160)
+        key = (flicker, self.facing)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            base_color = (232, 240, 252) if not flicker else (120, 140, 160)
+            sprite = self._render_sprite(base_color, self.facing)
+            self._sprite_cache[key] = sprite
+        surf.blit(sprite, (int(self.x) - 50, int(self.y) - 40))
+
+    @staticmethod
+    def _render_sprite(base_color: Tuple[int, int, int], facing: int) -> pygame.Surface:
+        """Draw the boat and sailor centred on a (100, 80) surface."""
+        sprite = _alpha_surface((100, 80))
         coat_color = (44, 84, 120)
         hat_color = (240, 176, 92)
         rod_color = (190, 230, 255)
 
-        px = int(self.x)
-        py = int(self.y)
-        facing = self.facing
+        px = 50
+        py = 40
 
         hull_color = (92, 58, 30)
         trim_color = (180, 132, 92)
         hull_rect = pygame.Rect(0, 0, 72, 20)
         hull_rect.center = (px, py + 24)
-        pygame.draw.ellipse(surf, hull_color, hull_rect)
-        pygame.draw.ellipse(surf, trim_color, hull_rect.inflate(-12, -6), 3)
+        pygame.draw.ellipse(sprite, hull_color, hull_rect)
+        pygame.draw.ellipse(sprite, trim_color, hull_rect.inflate(-12, -6), 3)
 
         bow = [
             (hull_rect.right - 4, hull_rect.centery - 10),
             (hull_rect.right + 10, hull_rect.centery),
             (hull_rect.right - 4, hull_rect.centery + 10),
         ]
-        pygame.draw.polygon(surf, hull_color, bow)
+        pygame.draw.polygon(sprite, hull_color, bow)
 
         stern = [
             (hull_rect.left + 4, hull_rect.centery - 10),
             (hull_rect.left - 10, hull_rect.centery - 4),
             (hull_rect.left + 4, hull_rect.centery + 10),
         ]
-        pygame.draw.polygon(surf, hull_color, stern)
+        pygame.draw.polygon(sprite, hull_color, stern)
 
         mast = pygame.Rect(0, 0, 6, 32)
         mast.center = (px, py)
-        pygame.draw.rect(surf, (158, 188, 210), mast, border_radius=3)
+        pygame.draw.rect(sprite, (158, 188, 210), mast, border_radius=3)
         pennant = [
             (mast.right, mast.top + 6),
             (mast.right + 18, mast.top + 10),
             (mast.right, mast.top + 16),
         ]
-        pygame.draw.polygon(surf, (230, 90, 96), pennant)
+        pygame.draw.polygon(sprite, (230, 90, 96), pennant)
 
         body_rect = pygame.Rect(0, 0, 18, 26)
         body_rect.center = (px, py)
-        pygame.draw.rect(surf, coat_color, body_rect, border_radius=4)
+        pygame.draw.rect(sprite, coat_color, body_rect, border_radius=4)
 
         head_rect = pygame.Rect(0, 0, 16, 16)
         head_rect.center = (px, py - 18)
-        pygame.draw.rect(surf, base_color, head_rect, border_radius=3)
+        pygame.draw.rect(sprite, base_color, head_rect, border_radius=3)
 
         brim = pygame.Rect(0, 0, 20, 6)
         brim.center = (px, py - 24)
-        pygame.draw.rect(surf, hat_color, brim, border_radius=3)
+        pygame.draw.rect(sprite, hat_color, brim, border_radius=3)
         crown = pygame.Rect(0, 0, 14, 8)
         crown.center = (px, py - 30)
-        pygame.draw.rect(surf, hat_color, crown, border_radius=3)
+        pygame.draw.rect(sprite, hat_color, crown, border_radius=3)
 
         arm_offset = 12 * facing
         pygame.draw.line(
-            surf,
+            sprite,
             base_color,
             (px, py - 2),
             (px + arm_offset, py + 4),
             4,
         )
         pygame.draw.line(
-            surf,
+            sprite,
             rod_color,
             (px + arm_offset, py + 4),
             (px + arm_offset + 16 * facing, py - 24),
             2,
         )
+        return sprite
 
     def damage(self) -> None:
         if self.iframes <= 0:
@@ -416,6 +702,8 @@ class Player:
 
 
 class Buoy:
+    _glow_surface: Optional[pygame.Surface] = None
+
     def __init__(self, x: float, y: float, target_x: float):
         self.base_x = x
         self.x = x
@@ -424,7 +712,7 @@ class Buoy:
         self.phase = random.uniform(0, math.pi * 2)
 
     def update(self, dt: float, phase: float, t: float) -> None:
-        self.phase += dt * 1.6
+        self.phase = (self.phase + dt * 1.6) % PHASE_PERIOD
         direction = -1 if self.base_x > self.target_x else 1
         self.base_x += direction * BUOY_DRIFT_SPEED * dt
         self.base_x = lerp(self.base_x, self.target_x, 0.4 * dt)
@@ -451,10 +739,17 @@ class Buoy:
         pygame.draw.ellipse(surf, float_color, body_rect)
         pygame.draw.ellipse(surf, band_color, body_rect.inflate(-6, -12))
 
-        glow = pygame.Surface((70, 70), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (240, 200, 72, 90), (35, 35), 30)
+        glow = self._glow()
         surf.blit(glow, glow.get_rect(center=(px, py - 42)))
 
+    @classmethod
+    def _glow(cls) -> pygame.Surface:
+        if cls._glow_surface is None:
+            glow = _alpha_surface((70, 70))
+            pygame.draw.circle(glow, (240, 200, 72, 90), (35, 35), 30)
+            cls._glow_surface = glow
+        return cls._glow_surface
+
     def collected_by(self, px: float, py: float) -> bool:
         dx = px - self.x
         dy = (py + 10) - self.y
@@ -462,6 +757,8 @@ class Buoy:
 
 
 class SpecialCatch:
+    _glow_surface: Optional[pygame.Surface] = None
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -470,7 +767,7 @@ class SpecialCatch:
         self.collected = False
 
     def update(self, dt: float, phase: float, t: float, target_x: float) -> None:
-        self.phase += dt * 2.4
+        self.phase = (self.phase + dt * 2.4) % (math.pi * 2)
         self.x += (target_x - self.x) * dt * 2.0
         crest = generate_wave_y(self.x, phase, t)
         wobble = math.sin(self.phase) * 8
@@ -485,12 +782,18 @@ class SpecialCatch:
             self.collected = True
         return self.collected
 
-    def draw(self, surf: pygame.Surface) -> None:
-        glow = pygame.Surface((40, 40), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (140, 220, 255, 110), (20, 20), 18)
-        pygame.draw.circle(glow, (240, 255, 170, 190), (20, 20), 10)
-        pygame.draw.circle(glow, (255, 255, 255, 220), (20, 20), 6)
-        surf.blit(glow, glow.get_rect(center=(int(self.x), int(self.y))))
+    def stamp(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        return self._glow(), (int(self.x) - 20, int(self.y) - 20)
+
+    @classmethod
+    def _glow(cls) -> pygame.Surface:
+        if cls._glow_surface is None:
+            glow = _alpha_surface((40, 40))
+            pygame.draw.circle(glow, (140, 220, 255, 110), (20, 20), 18)
+            pygame.draw.circle(glow, (240, 255, 170, 190), (20, 20), 10)
+            pygame.draw.circle(glow, (255, 255, 255, 220), (20, 20), 6)
+            cls._glow_surface = glow
+        return cls._glow_surface
 
 
 @dataclass
@@ -503,8 +806,15 @@ class ComboPopup:
         self.ttl -= dt
         self.pos.y -= 24 * dt
 
-    def draw(self, surf: pygame.Surface):
-        surf.blit(self.text, self.pos)
+
+def warm_up_kernels() -> None:
+    """Pay the one-off JIT compile at startup instead of on the first frame."""
+    if njit is None:
+        return
+    # Same strided layout as Game._mesh_xy[:, 1], so the live call reuses this specialisation.
+    build_wave_mesh(0.0, 0.0, np.empty((WAVE_POINTS + 1, 2))[:, 1])
+    EnemySchool().update(0.0, 0.0, 0.0)
+    ParticleField().update(0.0)
 
 
 class Game:
@@ -514,16 +824,54 @@ class Game:
         self.font = font
         self.title_font = large_font
         self.sky_surface = self._build_sky()
+        self._water_deep, self._water_strip = self._build_water_layers()
+        # Per-frame scratch layers, cleared in place rather than reallocated.
+        self._water_layer = _alpha_surface((WIDTH, HEIGHT))
+        self._foam_layer = _alpha_surface((WIDTH, HEIGHT))
+        self._curl_layer = _alpha_surface((220, 200))
+        self._water_columns = np.arange(WIDTH)
+        self._water_column_list = self._water_columns.tolist()
+        self._crest_glow = self._under_glow(CREST_COLOR)
+        self._foam_dots = {
+            r: _dot_surface(r, FOAM_COLOR) for r in range(FOAM_MIN_RADIUS, 20)
+        }
+        foam_glow = (*self._under_glow(FOAM_COLOR[:3]), FOAM_COLOR[3])
+        self._foam_glow_dots = {
+            r: _dot_surface(r, foam_glow) for r in range(FOAM_MIN_RADIUS, 20)
+        }
+        self._curl_spray = self._build_curl_spray()
+        self._banner_box = _alpha_surface((440, 60))
+        pygame.draw.rect(
+            self._banner_box, (12, 28, 48), self._banner_box.get_rect(), border_radius=18
+        )
+        self._pause_dim = _alpha_surface((WIDTH, HEIGHT))
+        self._pause_dim.fill((8, 18, 28, 160))
+        self._pause_title = self.title_font.render("Paused", True, UI_TEXT).convert_alpha()
+        self._pause_hint = render_ui_text("Press P or click resume to continue", UI_ACCENT)
+        self._game_over_title = self.title_font.render("Game Over", True, UI_ACCENT).convert_alpha()
         self.combo_popups: List[ComboPopup] = []
-        self.hit_sound = create_tone(220, duration=0.18, volume=0.5)
-        self.pulse_sound = create_tone(660, duration=0.1, volume=0.35)
-        self.score_sound = create_tone(440, duration=0.12, volume=0.4)
-        self.special_sound = create_tone(880, duration=0.16, volume=0.35)
+        self.rng = np.random.default_rng()
+        self._mesh_xy = np.empty((WAVE_POINTS + 1, 2))
+        self._mesh_xy[:, 0] = _WAVE_X
+        self._crest_xy = self._mesh_xy.copy()
+        self.wave_mesh: List[List[int]] = []
+        self.hit_sound = HIT_SOUND
+        self.pulse_sound = PULSE_SOUND
+        self.score_sound = SCORE_SOUND
+        self.special_sound = SPECIAL_SOUND
+        warm_up_kernels()
 
         self.state = "intro"
         self.state_timer = 0.0
         self.paused = False
+        self._dirty = True
+        self._paused_drawn = False
         self.pause_rect = pygame.Rect(WIDTH - 132, 96, 100, 32)
+        self._progress_rect = pygame.Rect(468, 48, 260, 18)
+        self._pulse_rect = pygame.Rect(760, 26, 180, 16)
+        self._relic_rect = pygame.Rect(960 - 180, 26, 150, 60)
+        self._panel_bg = self._build_panel()
+        self._relic_box = self._build_relic_box()
         self.pending_shot = False
         self.pending_pulse = False
         self.pending_special = False
@@ -538,19 +886,104 @@ class Game:
         self.reset()
 
     def _build_sky(self) -> pygame.Surface:
+        t = (np.arange(HEIGHT) / HEIGHT)[:, None]
+        rows = lerp(np.array(BACKGROUND_TOP), np.array(BACKGROUND_BOTTOM), t)
         surf = pygame.Surface((WIDTH, HEIGHT))
-        for i in range(HEIGHT):
-            t = i / HEIGHT
-            r = int(lerp(BACKGROUND_TOP[0], BACKGROUND_BOTTOM[0], t))
-            g = int(lerp(BACKGROUND_TOP[1], BACKGROUND_BOTTOM[1], t))
-            b = int(lerp(BACKGROUND_TOP[2], BACKGROUND_BOTTOM[2], t))
-            pygame.draw.line(surf, (r, g, b), (0, i), (WIDTH, i))
+        pixels = pygame.surfarray.pixels3d(surf)
+        pixels[:, :, :] = rows.astype(np.uint8)[None, :, :]
+        del pixels  # release the surface lock before converting
         return surf.convert()
 
+    def _build_water_layers(self) -> Tuple[pygame.Color, pygame.Surface]:
+        """Pre-composite the water fill, depth bands and glow under a flat swell.
+
+        ``draw_water`` shears the returned one-pixel depth strip onto the live
+        wave column by column, so the bands still follow the surface; the
+        returned colour is what that composite settles to below the strip.
+        """
+        glow = _alpha_surface((1, HEIGHT))
+        glow.fill((*WATER_GLOW, 80))
+        body = _alpha_surface((1, HEIGHT))
+        body.fill(WATER_BOTTOM)
+        # 40 two-pixel bands on a three-pixel pitch, darkening and fading with depth.
+        i = np.arange(40)
+        band_colors = np.empty((40, 4))
+        band_colors[:, :3] = np.array(WATER_TOP) * lerp(0.25, 0.85, i / 40)[:, None]
+        band_colors[:, 3] = 80 - i * 1.5
+        rows = WATER_STRIP_LEAD + i * 3
+        column = np.zeros((HEIGHT, 4), dtype=np.uint8)
+        column[rows] = column[rows + 1] = band_colors.astype(np.uint8)
+        bands = _alpha_surface((1, HEIGHT))
+        pygame.surfarray.pixels3d(bands)[0] = column[:, :3]
+        pygame.surfarray.pixels_alpha(bands)[0] = column[:, 3]
+        body.blit(bands, (0, 0))
+        body.blit(glow, (0, 0))
+        strip = body.subsurface((0, 0, 1, WATER_STRIP_LEAD + 40 * 3 + 2)).copy()
+
+        return body.get_at((0, HEIGHT - 1)), strip
+
+    @staticmethod
+    def _under_glow(color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Tint a crest or foam colour as if the glow were blitted over it.
+
+        The glow only covers the water below the surface line, so ``draw_water``
+        uses these tinted copies there and the plain colours above it.
+        """
+        tinted = pygame.Surface((1, 1))
+        tinted.fill(color)
+        glow = _alpha_surface((1, 1))
+        glow.fill((*WATER_GLOW, 80))
+        tinted.blit(glow, (0, 0))
+        return tuple(tinted.get_at((0, 0)))[:3]
+
+    @staticmethod
+    def _build_curl_spray() -> pygame.Surface:
+        """Render the spray bands once; they only ever translate with the lip tip."""
+        ox, oy = CURL_SPRAY_ORIGIN
+        spray = _alpha_surface((ox + 28, oy + 100))
+        for i in range(6):
+            shade = 160 - i * 18
+            band_points = [
+                (ox - 60 + i * 8, oy + 46 + i * 10),
+                (ox - 14, oy + 30 + i * 6),
+                (ox + 18, oy + 12 + i * 4),
+                (ox + 24, oy + i * 14),
+            ]
+            pygame.draw.lines(spray, (200, 244, 255, max(40, shade)), False, band_points, 2)
+        return spray
+
+    def _build_panel(self) -> pygame.Surface:
+        """Draw the HUD chrome that never changes; ``draw_ui`` layers live values on top."""
+        panel = _alpha_surface((WIDTH, 136))
+        pygame.draw.rect(panel, UI_PANEL, (12, 10, WIDTH - 24, 116), border_radius=18)
+        pygame.draw.rect(panel, (24, 52, 88), (20, 18, WIDTH - 40, 100), 2, border_radius=16)
+        pygame.draw.rect(panel, (24, 56, 92), (32, 24, 220, 36), border_radius=12)
+        pygame.draw.rect(panel, (24, 62, 110), (268, 24, 180, 36), border_radius=12)
+        pygame.draw.rect(panel, (16, 42, 68), self._progress_rect, border_radius=9)
+        pygame.draw.rect(panel, (24, 52, 88), self._pulse_rect, border_radius=9)
+
+        control_txt = self.font.render(
+            "Space Jump  •  Double-tap Space High Jump  •  L-Click Harpoon  •  R-Click Pulse  •  F Tidal Surge  •  P Pause",
+            True,
+            UI_MUTED,
+        )
+        panel.blit(control_txt, (32, 108))
+
+        pygame.draw.rect(panel, (28, 58, 98), self.pause_rect, border_radius=12)
+        pygame.draw.rect(panel, UI_ACCENT, self.pause_rect, 2, border_radius=12)
+        return panel
+
+    def _build_relic_box(self) -> pygame.Surface:
+        # Kept apart from the panel because it sits over the end of the pulse bar.
+        box = _alpha_surface(self._relic_rect.size)
+        pygame.draw.rect(box, (30, 70, 116), box.get_rect(), border_radius=14)
+        box.blit(self.font.render("Tidal Relics", True, UI_TEXT), (16, 6))
+        return box
+
     def reset(self):
         self.player = Player()
-        self.enemies: List[Enemy] = []
-        self.particles: List[Particle] = []
+        self.enemies = EnemySchool()
+        self.particles = ParticleField(capacity=128)
         self.pulses: List[Pulse] = []
         self.harpoons: List[Harpoon] = []
         self.special_catches = []
@@ -582,33 +1015,32 @@ class Game:
 
     def spawn_enemy_wave(self):
         stage_factor = min(self.stage, 12)
-        n = random.randint(3, 4 + stage_factor // 2)
-        spacing = random.randint(22, 40)
+        rng = self.rng
+        n = int(rng.integers(3, 5 + stage_factor // 2))
+        spacing = int(rng.integers(22, 41))
         start_x = WIDTH + 50
         speed_boost = 0.9 + (stage_factor - 1) * 0.08
-        base_speed = random.uniform(ENEMY_MIN_SPEED, ENEMY_MAX_SPEED) * speed_boost
-        variants = ["standard", "hopper", "diver", "charger"]
-        weights = [0.45, 0.22, 0.2, min(0.18 + 0.025 * stage_factor, 0.42)]
-        for i in range(n):
-            variant = random.choices(variants, weights=weights)[0]
-            jitter = random.uniform(0.88, 1.12)
-            enemy = Enemy(start_x + i * spacing, base_speed * jitter, variant)
-            self.enemies.append(enemy)
+        base_speed = rng.uniform(ENEMY_MIN_SPEED, ENEMY_MAX_SPEED) * speed_boost
+        # Odds for ENEMY_VARIANTS in order; chargers grow more common with the stage.
+        weights = np.array([0.45, 0.22, 0.2, min(0.18 + 0.025 * stage_factor, 0.42)])
+        self.enemies.spawn(
+            start_x + np.arange(n) * spacing,
+            base_speed * rng.uniform(0.88, 1.12, n),
+            rng.choice(len(ENEMY_VARIANTS), size=n, p=weights / weights.sum()),
+            rng.uniform(0, math.pi * 2, n),
+        )
 
         spawner_x = WIDTH - 48
         spawner_y = generate_wave_y(WIDTH + 20, self.phase, self.runtime)
-        for _ in range(8):
-            ang = random.uniform(-0.4, 0.4)
-            speed = random.uniform(90, 140)
-            self.particles.append(
-                Particle(
-                    spawner_x + random.uniform(-10, 10),
-                    spawner_y - random.uniform(10, 30),
-                    -speed * abs(math.cos(ang)) * random.uniform(0.8, 1.1),
-                    -speed * math.sin(ang),
-                    life=0.8,
-                )
-            )
+        ang = rng.uniform(-0.4, 0.4, 8)
+        speed = rng.uniform(90, 140, 8)
+        self.particles.emit(
+            spawner_x + rng.uniform(-10, 10, 8),
+            spawner_y - rng.uniform(10, 30, 8),
+            -speed * np.abs(np.cos(ang)) * rng.uniform(0.8, 1.1, 8),
+            -speed * np.sin(ang),
+            life=0.8,
+        )
 
     def _goal_for_stage(self, stage: int) -> int:
         return 8 + stage * 4
@@ -629,12 +1061,13 @@ class Game:
         return names[min(stage - 1, len(names) - 1)]
 
     def add_combo_popup(self, text: str, x: float, y: float):
-        surf = self.font.render(text, True, UI_ACCENT)
+        surf = render_ui_text(text, UI_ACCENT)
         popup = ComboPopup(surf, pygame.Vector2(x - surf.get_width() / 2, y - 30), 0.9)
         self.combo_popups.append(popup)
 
     def handle_events(self) -> bool:
         for event in pygame.event.get():
+            self._dirty = True
             if event.type == pygame.QUIT:
                 return False
             if event.type == pygame.KEYDOWN:
@@ -688,7 +1121,7 @@ class Game:
             return
 
         self.runtime += dt
-        self.phase += WAVE_SPEED * dt
+        self.phase = (self.phase + WAVE_SPEED * dt) % PHASE_PERIOD
         self.spawner_phase = (self.spawner_phase + dt) % (math.pi * 2)
 
         self.shoot_timer = max(0.0, self.shoot_timer - dt)
@@ -704,8 +1137,7 @@ class Game:
                 self.pulse_sound.play()
         self.pending_pulse = False
 
-        mesh = build_wave_mesh(self.phase, self.runtime)
-        self.wave_mesh = mesh
+        self._update_mesh(self.phase, self.runtime)
 
         jump = self.jump_request
         self.jump_request = None
@@ -716,14 +1148,14 @@ class Game:
             self.spawn_timer = 0.0
             self.spawn_enemy_wave()
 
-        for enemy in self.enemies:
-            enemy.update(dt, self.phase, self.runtime)
+        self.enemies.update(dt, self.phase, self.runtime)
 
         for pulse in self.pulses:
             pulse.update(dt)
 
+        time_phase = pygame.time.get_ticks() * 0.002
         for harpoon in self.harpoons:
-            harpoon.update(dt)
+            harpoon.update(dt, time_phase)
 
         if self.buoy:
             self.buoy.update(dt, self.phase, self.runtime)
@@ -731,66 +1163,87 @@ class Game:
         for catch in self.special_catches:
             catch.update(dt, self.phase, self.runtime, self.player.x)
 
-        for enemy in self.enemies:
-            if not enemy.alive:
-                continue
-            dx = enemy.x - self.player.x
-            dy = enemy.y - self.player.y
-            if dx * dx + dy * dy <= (ENEMY_RADIUS + PLAYER_RADIUS) ** 2:
+        enemies = self.enemies
+        n = enemies.count
+        ex = enemies.x[:n]
+        ey = enemies.y[:n]
+        dx = ex - self.player.x
+        dy = ey - self.player.y
+        rammed = dx * dx + dy * dy <= (ENEMY_RADIUS + PLAYER_RADIUS) ** 2
+        harpoons = [harpoon for harpoon in self.harpoons if harpoon.alive]
+        pulses = [pulse for pulse in self.pulses if pulse.alive]
+        # Hits are found in bulk, then resolved per enemy in index order, ram
+        # before harpoon before pulse, so combos, popups and specials come out
+        # in that order.
+        harpoon_hits = np.zeros((n, len(harpoons)), dtype=bool)
+        if harpoons:
+            hx = np.array([harpoon.x for harpoon in harpoons])
+            hy = np.array([harpoon.y for harpoon in harpoons])
+            dx = ex[:, None] - hx[None, :]
+            dy = ey[:, None] - hy[None, :]
+            harpoon_hits = dx * dx + dy * dy <= (ENEMY_RADIUS + 6) ** 2
+        pulse_hits = np.zeros(n, dtype=bool)
+        if pulses:
+            px = np.array([pulse.x for pulse in pulses])
+            py = np.array([pulse.y for pulse in pulses])
+            reach = np.array([pulse.r for pulse in pulses]) + ENEMY_RADIUS
+            dx = ex[:, None] - px[None, :]
+            dy = ey[:, None] - py[None, :]
+            pulse_hits = (dx * dx + dy * dy <= reach * reach).any(axis=1)
+
+        hit = enemies.alive[:n] & (rammed | harpoon_hits.any(axis=1) | pulse_hits)
+        for i in np.flatnonzero(hit):
+            if rammed[i]:
                 self.player.damage()
-                enemy.alive = False
+                enemies.alive[i] = False
                 if self.hit_sound:
                     self.hit_sound.play()
                 if self.player.health <= 0:
                     self.state = "game_over"
                 continue
 
-            for harpoon in self.harpoons:
-                if harpoon.alive and enemy.alive:
-                    hx = enemy.x - harpoon.x
-                    hy = enemy.y - harpoon.y
-                    if hx * hx + hy * hy <= (ENEMY_RADIUS + 6) ** 2:
-                        enemy.alive = False
-                        harpoon.alive = False
-                        self.player.reward_combo(1)
-                        reward = 60 + 16 * self.player.combo
-                        self.player.score += reward
-                        self.add_combo_popup(f"Harpoon +{reward}", enemy.x, enemy.y)
-                        self.pulse_energy = min(
-                            PULSE_ENERGY_MAX, self.pulse_energy + PULSE_GAIN_ON_HIT
-                        )
-                        self.kills_this_stage += 1
-                        self._maybe_spawn_special(enemy.x, enemy.y)
-                        if self.score_sound:
-                            self.score_sound.play()
-                        self._check_stage_progression()
-                        break
-
-            for pulse in self.pulses:
-                if pulse.alive and enemy.alive and enemy.hit_by_pulse(pulse):
-                    enemy.alive = False
-                    self.player.reward_combo(1)
-                    reward = 80 + 20 * self.player.combo
-                    self.player.score += reward
-                    self.add_combo_popup(f"+{reward} x{self.player.combo}", enemy.x, enemy.y)
-                    self.pulse_energy = min(
-                        PULSE_ENERGY_MAX, self.pulse_energy + PULSE_GAIN_ON_HIT * 0.5
-                    )
-                    self.kills_this_stage += 1
-                    self._maybe_spawn_special(enemy.x, enemy.y)
-                    self._check_stage_progression()
-                    if self.score_sound:
-                        self.score_sound.play()
-                    break
-
-        self.enemies = [enemy for enemy in self.enemies if enemy.alive]
+            for j in np.flatnonzero(harpoon_hits[i]):
+                harpoon = harpoons[j]
+                if not harpoon.alive:
+                    continue
+                enemies.alive[i] = False
+                harpoon.alive = False
+                self.player.reward_combo(1)
+                reward = 60 + 16 * self.player.combo
+                self.player.score += reward
+                self.add_combo_popup(f"Harpoon +{reward}", float(ex[i]), float(ey[i]))
+                self.pulse_energy = min(
+                    PULSE_ENERGY_MAX, self.pulse_energy + PULSE_GAIN_ON_HIT
+                )
+                self.kills_this_stage += 1
+                self._maybe_spawn_special(float(ex[i]), float(ey[i]))
+                if self.score_sound:
+                    self.score_sound.play()
+                self._check_stage_progression()
+                break
+
+            if enemies.alive[i] and pulse_hits[i]:
+                enemies.alive[i] = False
+                self.player.reward_combo(1)
+                reward = 80 + 20 * self.player.combo
+                self.player.score += reward
+                self.add_combo_popup(
+                    f"+{reward} x{self.player.combo}", float(ex[i]), float(ey[i])
+                )
+                self.pulse_energy = min(
+                    PULSE_ENERGY_MAX, self.pulse_energy + PULSE_GAIN_ON_HIT * 0.5
+                )
+                self.kills_this_stage += 1
+                self._maybe_spawn_special(float(ex[i]), float(ey[i]))
+                self._check_stage_progression()
+                if self.score_sound:
+                    self.score_sound.play()
+
+        self.enemies.compact()
         self.pulses = [pulse for pulse in self.pulses if pulse.alive]
         self.harpoons = [harpoon for harpoon in self.harpoons if harpoon.alive]
-        self.special_catches = [catch for catch in self.special_catches if not catch.collected]
 
-        for particle in self.particles:
-            particle.update(dt)
-        self.particles = [particle for particle in self.particles if particle.life > 0]
+        self.particles.update(dt)
 
         if self.buoy and self.buoy.collected_by(self.player.x, self.player.y):
             self._advance_stage()
@@ -822,6 +1275,11 @@ class Game:
 
         self.high_score = max(self.high_score, int(self.player.score))
 
+    def _update_mesh(self, phase: float, t: float) -> None:
+        build_wave_mesh(phase, t, self._mesh_xy[:, 1])
+        # Integer vertices: pygame truncates them anyway, and ints skip its float path.
+        self.wave_mesh = self._mesh_xy.astype(int).tolist()
+
     def fire_harpoon(self) -> None:
         direction = self.player.facing or 1
         start_x = self.player.x + direction * (PLAYER_RADIUS + 14)
@@ -871,15 +1329,16 @@ class Game:
         if self.special_sound:
             self.special_sound.play()
         strike_count = 0
-        for enemy in list(self.enemies):
-            if not enemy.alive:
+        enemies = self.enemies
+        for i in range(enemies.count):
+            if not enemies.alive[i]:
                 continue
-            enemy.alive = False
+            enemies.alive[i] = False
             strike_count += 1
             self.player.reward_combo(2)
             reward = 140 + 24 * self.player.combo
             self.player.score += reward
-            self.add_combo_popup("Tidal Surge!", enemy.x, enemy.y)
+            self.add_combo_popup("Tidal Surge!", float(enemies.x[i]), float(enemies.y[i]))
             self.kills_this_stage += 1
             if strike_count >= 4:
                 break
@@ -888,64 +1347,77 @@ class Game:
             self.pulses.append(Pulse(self.player.x, self.player.y - 10))
 
     def draw_background(self):
-        self.screen.blit(self.sky_surface, (0, 0))
+        if not self.wave_mesh:
+            self.screen.blit(self.sky_surface, (0, 0))
+            return
+        # The water layer is opaque below its surface, so the sky stops at the deepest trough.
+        depth = min(HEIGHT, int(self._mesh_xy[:, 1].max()) + 2)
+        self.screen.blit(self.sky_surface, (0, 0), (0, 0, WIDTH, depth))
 
     def draw_water(self):
-        mesh = getattr(self, "wave_mesh", [])
-        poly = [(0, HEIGHT)] + mesh + [(WIDTH, HEIGHT)]
-        if len(poly) >= 3:
-            water_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            pygame.draw.polygon(water_surface, WATER_BOTTOM, poly)
-            gradient_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            for i in range(40):
-                shade = lerp(0.25, 0.85, i / 40)
-                color = (
-                    int(WATER_TOP[0] * shade),
-                    int(WATER_TOP[1] * shade),
-                    int(WATER_TOP[2] * shade),
-                    int(80 - i * 1.5),
-                )
-                offset_poly = [
-                    (x, y + i * 3)
-                    for x, y in mesh
-                ]
-                pygame.draw.lines(gradient_surface, color, False, offset_poly, 2)
-            water_surface.blit(gradient_surface, (0, 0))
-
-            crest = [
+        mesh = self.wave_mesh
+        if mesh:
+            # Nothing is drawn more than WATER_OVERHANG above the highest crest, so
+            # the rows above that band are neither cleared nor composited.
+            band_top = max(0, int(self._mesh_xy[:, 1].min()) - WATER_OVERHANG)
+            band = pygame.Rect(0, band_top, WIDTH, HEIGHT - band_top)
+            water_surface = self._water_layer
+            water_surface.fill(self._water_deep, band)
+            surface_y = np.interp(self._water_columns, self._mesh_xy[:, 0], self._mesh_xy[:, 1])
+            tops = (surface_y - WATER_STRIP_LEAD).astype(int).tolist()
+            strip = self._water_strip
+            water_surface.blits(
+                [(strip, (x, y)) for x, y in zip(self._water_column_list, tops)], doreturn=0
+            )
+
+            crest = self._crest_xy
+            crest[:, 1] = self._mesh_xy[:, 1] + np.sin(_WAVE_X * 0.01 + self.runtime * 1.6) * 5
+            crest_points = crest.tolist()
+
+            xs, ys = self._mesh_xy[:, 0], self._mesh_xy[:, 1]
+            centers = np.arange(2, len(ys) - 2, 2)
+            slope = np.abs(ys[centers + 2] - ys[centers - 2])
+            calm = slope < 14
+            centers = centers[calm]
+            radii = (FOAM_MIN_RADIUS + (14 - slope[calm]) * 0.8).astype(int).tolist()
+            left = (xs[centers].astype(int) - radii).tolist()
+            top = ((ys[centers] - 6).astype(int) - radii).tolist()
+            foam = list(zip(radii, left, top))
+
+            # The crest and foam stick out above the surface, where the water
+            # layer is cleared and they show untinted; drawing them onto the
+            # screen first leaves the water layer to cover them below the line
+            # with its glow-tinted copies. Each pass only composites foam in the
+            # rows where its copy can end up visible.
+            crest_top, crest_bottom = int(ys.min()), int(ys.max())
+            foam_surface = self._foam_layer
+            for target, crest_color, dots, rows in (
+                (self.screen, CREST_COLOR, self._foam_dots, (band_top, crest_bottom + 2)),
                 (
-                    x,
-                    y + math.sin((x * 0.01) + self.runtime * 1.6) * 5,
+                    water_surface,
+                    self._crest_glow,
+                    self._foam_glow_dots,
+                    (crest_top, min(HEIGHT, crest_bottom + WATER_OVERHANG)),
+                ),
+            ):
+                pygame.draw.lines(target, crest_color, False, crest_points, 3)
+                area = pygame.Rect(0, rows[0], WIDTH, rows[1] - rows[0])
+                foam_surface.fill((0, 0, 0, 0), area)
+                # MAX keeps overlapping dots flat, like drawing them straight in.
+                foam_surface.blits(
+                    [(dots[r], (x, y), None, pygame.BLEND_RGBA_MAX) for r, x, y in foam],
+                    doreturn=0,
                 )
-                for x, y in mesh
-            ]
-            pygame.draw.lines(water_surface, (224, 248, 255), False, crest, 3)
-
-            foam_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            for i in range(2, len(mesh) - 2, 2):
-                prev_y = mesh[i - 2][1]
-                next_y = mesh[i + 2][1]
-                slope = abs(next_y - prev_y)
-                if slope < 14:
-                    px, py = mesh[i]
-                    radius = 8 + (14 - slope) * 0.8
-                    pygame.draw.circle(
-                        foam_surface,
-                        (240, 252, 255, 160),
-                        (int(px), int(py - 6)),
-                        int(radius),
-                    )
-            water_surface.blit(foam_surface, (0, 0))
-
-            glow_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            pygame.draw.polygon(glow_surface, (*WATER_GLOW, 80), poly)
-            water_surface.blit(glow_surface, (0, 0))
-
-            self.screen.blit(water_surface, (0, 0))
+                target.blit(foam_surface, area, area)
+
+            # Clear everything above the live surface line so the sky shows through.
+            pygame.draw.polygon(water_surface, (0, 0, 0, 0), [(0, 0)] + mesh + [(WIDTH, 0)])
+            self.screen.blit(water_surface, band, band)
 
         spawner_x = WIDTH - 32
         spawner_y = generate_wave_y(WIDTH + 60, self.phase, self.runtime) - 16
-        curl_surface = pygame.Surface((220, 200), pygame.SRCALPHA)
+        curl_surface = self._curl_layer
+        curl_surface.fill((0, 0, 0, 0))
         lip_base = 96 + math.sin(self.runtime * 1.2) * 6
         lip_tip_y = lip_base - 36
         lip_tip_x = 170 + math.sin(self.runtime * 1.8) * 12
@@ -999,98 +1471,58 @@ class Game:
         ]
         pygame.draw.aalines(curl_surface, (248, 255, 255, 210), False, highlight_curve)
 
-        for i in range(5):
+        # Droplets overwrite the curl body rather than blend over it, so they
+        # are drawn straight in instead of stamped.
+        for i, radius in enumerate(_FOAM_RADII):
             wobble = math.sin(self.runtime * 2.0 + i * 0.8) * 3
-            foam_pos = (
-                lip_tip_x - 24 + i * 10,
-                lip_base + 10 + i * 6 + wobble,
-            )
             pygame.draw.circle(
                 curl_surface,
                 (240, 255, 255, 200 - i * 30),
-                (int(foam_pos[0]), int(foam_pos[1])),
-                max(2, 5 - i),
-            )
-
-        spray_surface = pygame.Surface((220, 200), pygame.SRCALPHA)
-        for i in range(6):
-            shade = 160 - i * 18
-            band_points = [
-                (lip_tip_x - 60 + i * 8, lip_base + 46 + i * 10),
-                (lip_tip_x - 14, lip_base + 30 + i * 6),
-                (lip_tip_x + 18, lip_base + 12 + i * 4),
-                (lip_tip_x + 24, lip_tip_y + 36 + i * 14),
-            ]
-            pygame.draw.lines(
-                spray_surface,
-                (200, 244, 255, max(40, shade)),
-                False,
-                band_points,
-                2,
+                (int(lip_tip_x - 24 + i * 10), int(lip_base + 10 + i * 6 + wobble)),
+                radius,
             )
-        curl_surface.blit(spray_surface, (0, 0))
+        ox, oy = CURL_SPRAY_ORIGIN
+        curl_surface.blit(self._curl_spray, (int(lip_tip_x) - ox, int(lip_base) - oy))
 
         self.screen.blit(curl_surface, (spawner_x - 120, spawner_y - 120))
 
     def draw_ui(self):
-        panel = pygame.Surface((WIDTH, 136), pygame.SRCALPHA)
-        pygame.draw.rect(panel, UI_PANEL, (12, 10, WIDTH - 24, 116), border_radius=18)
-        pygame.draw.rect(panel, (24, 52, 88), (20, 18, WIDTH - 40, 100), 2, border_radius=16)
+        screen = self.screen
+        screen.blit(self._panel_bg, (0, 0))
 
-        score_block = pygame.Rect(32, 24, 220, 36)
-        pygame.draw.rect(panel, (24, 56, 92), score_block, border_radius=12)
-        score_txt = self.font.render(f"Score {int(self.player.score):07d}", True, UI_TEXT)
-        panel.blit(score_txt, (score_block.x + 12, score_block.y + 6))
-        best_txt = self.font.render(f"Best {self.high_score:07d}", True, UI_MUTED)
-        panel.blit(best_txt, (score_block.x + 12, score_block.y + 26))
-
-        combo_block = pygame.Rect(268, 24, 180, 36)
-        pygame.draw.rect(panel, (24, 62, 110), combo_block, border_radius=12)
-        combo_txt = self.font.render(f"Combo ×{self.player.combo:02d}", True, UI_ACCENT)
-        panel.blit(combo_txt, (combo_block.x + 12, combo_block.y + 6))
-        best_combo_txt = self.font.render(
-            f"Peak ×{self.player.best_combo:02d}", True, UI_MUTED
-        )
-        panel.blit(best_combo_txt, (combo_block.x + 12, combo_block.y + 24))
+        screen.blit(render_ui_text(f"Score {int(self.player.score):07d}", UI_TEXT), (44, 30))
+        screen.blit(render_ui_text(f"Best {self.high_score:07d}", UI_MUTED), (44, 50))
+        screen.blit(render_ui_text(f"Combo ×{self.player.combo:02d}", UI_ACCENT), (280, 30))
+        screen.blit(render_ui_text(f"Peak ×{self.player.best_combo:02d}", UI_MUTED), (280, 48))
 
         stage_ratio = min(1.0, self.kills_this_stage / self.stage_goal)
         stage_name = self._stage_name(self.stage)
-        stage_header = self.font.render(
-            f"Stage {self.stage:02d} — {stage_name}", True, UI_TEXT
-        )
-        panel.blit(stage_header, (468, 20))
-        progress_rect = pygame.Rect(468, 48, 260, 18)
-        pygame.draw.rect(panel, (16, 42, 68), progress_rect, border_radius=9)
-        fill_rect = progress_rect.copy()
-        fill_rect.width = max(6, int(progress_rect.width * stage_ratio))
-        pygame.draw.rect(panel, (96, 222, 255), fill_rect, border_radius=9)
+        screen.blit(render_ui_text(f"Stage {self.stage:02d} — {stage_name}", UI_TEXT), (468, 20))
+        fill_rect = self._progress_rect.copy()
+        fill_rect.width = max(6, int(fill_rect.width * stage_ratio))
+        pygame.draw.rect(screen, (96, 222, 255), fill_rect, border_radius=9)
         status = "Collect buoy" if self.awaiting_buoy else f"{self.kills_this_stage}/{self.stage_goal} catches"
-        kill_txt = self.font.render(status, True, UI_MUTED)
-        panel.blit(kill_txt, (progress_rect.x, progress_rect.bottom + 6))
+        screen.blit(render_ui_text(status, UI_MUTED), (fill_rect.x, fill_rect.bottom + 6))
 
         pulse_ratio = self.pulse_energy / PULSE_ENERGY_MAX
-        pulse_rect = pygame.Rect(760, 26, 180, 16)
-        pygame.draw.rect(panel, (24, 52, 88), pulse_rect, border_radius=9)
-        pulse_fill = pulse_rect.copy()
-        pulse_fill.width = int(pulse_rect.width * pulse_ratio)
-        pygame.draw.rect(panel, (120, 236, 252), pulse_fill, border_radius=9)
+        pulse_fill = self._pulse_rect.copy()
+        pulse_fill.width = int(pulse_fill.width * pulse_ratio)
+        pygame.draw.rect(screen, (120, 236, 252), pulse_fill, border_radius=9)
         ready_txt = "Ready" if pulse_ratio >= 1.0 else f"Charging {int(pulse_ratio * 100)}%"
-        pulse_label = self.font.render(f"Pulse {ready_txt}", True, UI_TEXT)
-        panel.blit(pulse_label, (pulse_rect.x, pulse_rect.y - 22))
+        screen.blit(render_ui_text(f"Pulse {ready_txt}", UI_TEXT), (pulse_fill.x, pulse_fill.y - 22))
 
-        relic_rect = pygame.Rect(960 - 180, 26, 150, 60)
-        pygame.draw.rect(panel, (30, 70, 116), relic_rect, border_radius=14)
-        relic_label = self.font.render("Tidal Relics", True, UI_TEXT)
-        panel.blit(relic_label, (relic_rect.x + 16, relic_rect.y + 6))
-        relic_txt = self.font.render(f"{self.special_stock}/{SPECIAL_MAX_STOCK}", True, UI_ACCENT)
-        panel.blit(relic_txt, (relic_rect.x + 16, relic_rect.y + 30))
+        relic_rect = self._relic_rect
+        screen.blit(self._relic_box, relic_rect)
+        relic_txt = render_ui_text(f"{self.special_stock}/{SPECIAL_MAX_STOCK}", UI_ACCENT)
+        screen.blit(relic_txt, (relic_rect.x + 16, relic_rect.y + 30))
 
         heart_base_x = relic_rect.x - 140
+
+        heart_rect = pygame.Rect(0, 0, 20, 18)
         for i in range(self.player.health):
-            heart_rect = pygame.Rect(0, 0, 20, 18)
             heart_rect.center = (heart_base_x + i * 32, 44)
             pygame.draw.polygon(
-                panel,
+                screen,
                 (255, 112, 148),
                 [
                     (heart_rect.centerx, heart_rect.top),
@@ -1100,20 +1532,8 @@ class Game:
                 ],
             )
 
-        control_txt = self.font.render(
-            "Space Jump  •  Double-tap Space High Jump  •  L-Click Harpoon  •  R-Click Pulse  •  F Tidal Surge  •  P Pause",
-            True,
-            UI_MUTED,
-        )
-        panel.blit(control_txt, (32, 108))
-
-        pygame.draw.rect(panel, (28, 58, 98), self.pause_rect, border_radius=12)
-        pygame.draw.rect(panel, UI_ACCENT, self.pause_rect, 2, border_radius=12)
-        pause_label = self.font.render("PAUSE" if not self.paused else "PLAY", True, UI_TEXT)
-        label_rect = pause_label.get_rect(center=self.pause_rect.center)
-        panel.blit(pause_label, label_rect)
-
-        self.screen.blit(panel, (0, 0))
+        pause_label = render_ui_text("PAUSE" if not self.paused else "PLAY", UI_TEXT)
+        screen.blit(pause_label, pause_label.get_rect(center=self.pause_rect.center))
 
         if self.state == "intro":
             intro_lines = [
@@ -1123,18 +1543,18 @@ class Game:
                 "Press Enter to begin or dive right in.",
             ]
             for i, line in enumerate(intro_lines):
-                surf = self.font.render(line, True, UI_TEXT)
+                surf = render_ui_text(line, UI_TEXT)
                 self.screen.blit(
                     surf,
                     (WIDTH / 2 - surf.get_width() / 2, HEIGHT * 0.32 + i * 28),
                 )
         elif self.state == "game_over":
-            over = self.title_font.render("Game Over", True, UI_ACCENT)
+            over = self._game_over_title
             self.screen.blit(
                 over,
                 (WIDTH / 2 - over.get_width() / 2, HEIGHT / 2 - 48),
             )
-            sub = self.font.render("Press R to restart the voyage", True, UI_TEXT)
+            sub = render_ui_text("Press R to restart the voyage", UI_TEXT)
             self.screen.blit(
                 sub,
                 (WIDTH / 2 - sub.get_width() / 2, HEIGHT / 2 + 4),
@@ -1147,65 +1567,67 @@ class Game:
         for pulse in self.pulses:
             pulse.draw(self.screen)
 
-        for harpoon in self.harpoons:
-            harpoon.draw(self.screen)
-
-        for catch in self.special_catches:
-            catch.draw(self.screen)
+        self.screen.blits(
+            [harpoon.stamp() for harpoon in self.harpoons if harpoon.alive], doreturn=0
+        )
+        self.screen.blits([catch.stamp() for catch in self.special_catches], doreturn=0)
 
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
 
         if self.buoy:
             self.buoy.draw(self.screen)
 
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        self.enemies.draw(self.screen)
 
         self.player.draw(self.screen)
-        for popup in self.combo_popups:
-            popup.draw(self.screen)
+        self.screen.blits(
+            [(popup.text, popup.pos) for popup in self.combo_popups], doreturn=0
+        )
         self.draw_ui()
 
         if self.stage_banner_timer > 0:
-            overlay = pygame.Surface((WIDTH, 120), pygame.SRCALPHA)
             alpha = int(180 * min(1.0, self.stage_banner_timer / 3.2))
-            banner_rect = pygame.Rect(0, 0, 440, 60)
-            banner_rect.center = (WIDTH // 2, int(HEIGHT * 0.2))
-            pygame.draw.rect(
-                overlay,
-                (12, 28, 48, alpha),
-                banner_rect,
-                border_radius=18,
-            )
-            title = self.title_font.render(self.stage_banner_text, True, UI_ACCENT)
-            title_rect = title.get_rect(center=banner_rect.center)
-            overlay.blit(title, title_rect)
-            self.screen.blit(overlay, (0, 0))
+            self._banner_box.set_alpha(alpha)
+            banner_rect = self._banner_box.get_rect(center=(WIDTH // 2, int(HEIGHT * 0.2)))
+            title = render_ui_text(self.stage_banner_text, UI_ACCENT, self.title_font)
+            # The banner has always been cropped to the top 120px of the screen.
+            self.screen.set_clip(pygame.Rect(0, 0, WIDTH, 120))
+            self.screen.blit(self._banner_box, banner_rect)
+            self.screen.blit(title, title.get_rect(center=banner_rect.center))
+            self.screen.set_clip(None)
 
         if self.paused and self.state == "gameplay":
-            dim = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            dim.fill((8, 18, 28, 160))
-            self.screen.blit(dim, (0, 0))
-            paused_text = self.title_font.render("Paused", True, UI_TEXT)
-            self.screen.blit(
-                paused_text,
-                (WIDTH / 2 - paused_text.get_width() / 2, HEIGHT / 2 - 30),
-            )
-            hint = self.font.render("Press P or click resume to continue", True, UI_ACCENT)
-            self.screen.blit(
-                hint,
-                (WIDTH / 2 - hint.get_width() / 2, HEIGHT / 2 + 8),
+            paused_text = self._pause_title
+            hint = self._pause_hint
+            self.screen.blits(
+                [
+                    (self._pause_dim, (0, 0)),
+                    (paused_text, (WIDTH / 2 - paused_text.get_width() / 2, HEIGHT / 2 - 30)),
+                    (hint, (WIDTH / 2 - hint.get_width() / 2, HEIGHT / 2 + 8)),
+                ],
+                doreturn=0,
             )
 
     def run(self):
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frozen = self.paused and self.state == "gameplay"
+            dt = self.clock.tick(PAUSED_FPS if frozen else FPS) / 1000.0
             running = self.handle_events()
             self.update(dt)
-            self.draw()
+            if self.paused and self.state == "gameplay":
+                # The world is frozen and nothing else draws to the screen, so the
+                # paused frame is drawn once and only re-flipped on input.
+                if not self._paused_drawn:
+                    self.draw()
+                    self._paused_drawn = True
+                elif not self._dirty:
+                    continue
+            else:
+                self._paused_drawn = False
+                self.draw()
             pygame.display.flip()
+            self._dirty = False
 
         pygame.quit()
         sys.exit(0)